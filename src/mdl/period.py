@@ -1,38 +1,56 @@
 from datetime import date, timedelta
 
+import numpy as np
+
 from src.utils.enums import Weekday
 
+# Indexed by isoweekday - 1
+_WEEKDAY_ABBREVIATIONS: tuple[str, ...] = tuple(
+    wd.name[:3].capitalize() for wd in Weekday
+)
+
 
 class HolidayPeriod:
+    __slots__ = ("__start_date", "__duration", "__end_date")
+
     __start_date: date
     __duration: int
+    __end_date: date
 
     def __init__(self, start_date: date, duration: int) -> None:
         self.__start_date = start_date
         self.__duration = duration
+        self.__end_date = start_date + timedelta(days=duration - 1)
+
+    @classmethod
+    def from_arrays(
+        cls, start_ordinals: np.ndarray, durations: np.ndarray, index: int
+    ) -> "HolidayPeriod":
+        return cls(date.fromordinal(int(start_ordinals[index])), int(durations[index]))
 
     def start_date(self) -> date:
         return self.__start_date
 
     def end_date(self) -> date:
-        return self.__start_date + timedelta(days=self.__duration - 1)
+        return self.__end_date
 
     def duration(self) -> int:
         return self.__duration
 
     def contains(self, datestamp: date) -> bool:
-        return self.start_date() <= datestamp <= self.end_date()
+        return self.__start_date <= datestamp <= self.__end_date
 
     def all_days(self) -> list[date]:
-        all_days = []
-        for i in range(self.duration()):
-            all_days.append(self.start_date() + timedelta(days=i))
-        return all_days
+        start_ordinal = self.__start_date.toordinal()
+        return [
+            date.fromordinal(ordinal)
+            for ordinal in range(start_ordinal, start_ordinal + self.__duration)
+        ]
 
     def __str__(self) -> str:
-        start_weekday = Weekday(self.start_date().isoweekday()).name
-        end_weekday = Weekday(self.end_date().isoweekday()).name
-        return f"{start_weekday[:3].capitalize()} {self.start_date()} - {end_weekday[:3].capitalize()} {self.end_date()}"
+        start_weekday = _WEEKDAY_ABBREVIATIONS[self.__start_date.isoweekday() - 1]
+        end_weekday = _WEEKDAY_ABBREVIATIONS[self.__end_date.isoweekday() - 1]
+        return f"{start_weekday} {self.__start_date} - {end_weekday} {self.__end_date}"
 
     def __repr__(self) -> str:
         return str(self)
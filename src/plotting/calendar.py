@@ -1,40 +1,56 @@
 from datetime import date
+from typing import TYPE_CHECKING
 
-import pandas as pd
-from plotly_calplot import calplot
-import plotly.graph_objects as go
+import numpy as np
 
 from src.config import ModelConfig
 from src.utils.enums import DayType
 
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# Hover text suffix per DayType value; regular days do not show a type
+_HOVER_TYPE_SUFFIXES = {
+    t.value: (
+        ""
+        if t == DayType.REGULAR
+        else f"<br>Type: {t.name.replace('_', ' ').capitalize()}"
+    )
+    for t in DayType
+}
+
 
 def _extract_highest_prio_type_per_date(
-    dates_by_type: dict[DayType, list[date]], ascending_prio: list[DayType]
-) -> dict[date, DayType]:
-    type_by_date = {}
+    dates_by_type: dict[DayType, list[date]],
+    ascending_prio: list[DayType],
+    start_date: date,
+    num_days: int,
+) -> np.ndarray:
+    # Type value per day offset from start_date; later types in ascending_prio overwrite earlier ones
+    type_by_offset = np.full(num_days, DayType.REGULAR.value, dtype=np.int8)
     for date_type in ascending_prio:
-        new_types = {d: date_type for d in dates_by_type.get(date_type, [])}
-        type_by_date.update(new_types)
-
-    return type_by_date
+        offsets = np.fromiter(
+            ((d - start_date).days for d in dates_by_type.get(date_type, [])),
+            dtype=np.int64,
+        )
+        offsets = offsets[(offsets >= 0) & (offsets < num_days)]
+        type_by_offset[offsets] = date_type.value
 
+    return type_by_offset
 
-def holiday_calendar_plot(dates_by_type: dict[DayType, list[date]]) -> go.Figure:
-    def make_hover_text(d: date, type_name: DayType) -> str:
-        week = d.isocalendar()[1]
-        hover_text = f"Date: {d}<br>Week: {week}"
-        if type_name != DayType.REGULAR:
-            type_string = type_name.name.replace("_", " ").capitalize()
-            hover_text += f"<br>Type: {type_string}"
 
-        return hover_text
+def holiday_calendar_plot(dates_by_type: dict[DayType, list[date]]) -> "go.Figure":
+    # Plotting libraries are imported here so that importing this module stays cheap
+    import pandas as pd
+    import plotly.graph_objects as go
+    from plotly_calplot import calplot
 
-    all_dates_in_period = pd.date_range(
-        ModelConfig.PLANNING_PERIOD_START_DATE,
-        ModelConfig.PLANNING_PERIOD_END_DATE,
-        freq="D",
+    all_dates_in_period = np.arange(
+        np.datetime64(ModelConfig.PLANNING_PERIOD_START_DATE),
+        np.datetime64(ModelConfig.PLANNING_PERIOD_END_DATE) + np.timedelta64(1, "D"),
+        dtype="datetime64[D]",
     )
-    dates_by_type[DayType.REGULAR] = [d.date() for d in all_dates_in_period]
+    dates_in_period = all_dates_in_period.astype(object).tolist()
 
     ascending_prio_for_visual = [
         DayType.REGULAR,
@@ -42,19 +58,28 @@ def holiday_calendar_plot(dates_by_type: dict[DayType, list[date]]) -> go.Figure
         DayType.WEEKEND,
         DayType.PUBLIC_HOLIDAY,
     ]
-    type_by_date = _extract_highest_prio_type_per_date(
-        dates_by_type, ascending_prio_for_visual
+    type_by_offset = _extract_highest_prio_type_per_date(
+        dates_by_type,
+        ascending_prio_for_visual,
+        ModelConfig.PLANNING_PERIOD_START_DATE,
+        len(dates_in_period),
     )
 
-    # Create records for all dates
-    records = []
-    for d, d_type in type_by_date.items():
-        records.append(
-            {"date": d, "value": d_type.value, "text": make_hover_text(d, d_type)}
+    # Create one column per plotted attribute for all dates
+    week_numbers = pd.DatetimeIndex(all_dates_in_period).isocalendar().week
+    hover_texts = [
+        f"Date: {d}<br>Week: {week}{_HOVER_TYPE_SUFFIXES[type_value]}"
+        for d, week, type_value in zip(
+            dates_in_period, week_numbers.tolist(), type_by_offset.tolist()
         )
-
-    df = pd.DataFrame(records)
-    df["date"] = df["date"].astype("datetime64[ns]")
+    ]
+    df = pd.DataFrame(
+        {
+            "date": all_dates_in_period.astype("datetime64[ns]"),
+            "value": type_by_offset,
+            "text": hover_texts,
+        }
+    )
 
     # Discrete colorscale for 4 categories (0=empty, 1=holiday, 2=weekend, 3=day off)
     colorscale = [
@@ -0,0 +1,109 @@
+from functools import cache
+from typing import Callable, Optional
+
+import numpy as np
+
+
+@cache
+def _kernels() -> Optional[tuple[Callable, Callable]]:
+    # Numba is optional and slow to import, so it is only loaded on the first bulk call.
+    # Without it, the wrappers below fall back to the equivalent NumPy expression.
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, cache=True, fastmath=True)
+    def compiled_bulk_period_sums(
+        cumulative_lookup: np.ndarray, start_offsets: np.ndarray, durations: np.ndarray
+    ) -> np.ndarray:
+        period_sums = np.empty(len(start_offsets), dtype=cumulative_lookup.dtype)
+        for i in prange(len(start_offsets)):
+            start = start_offsets[i]
+            period_sums[i] = (
+                cumulative_lookup[start + durations[i]] - cumulative_lookup[start]
+            )
+
+        return period_sums
+
+    @njit(parallel=True, cache=True, fastmath=True)
+    def compiled_bulk_period_cost_and_value_sums(
+        cumulative_cost_lookup: np.ndarray,
+        cumulative_value_lookup: np.ndarray,
+        start_offsets: np.ndarray,
+        durations: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        period_costs = np.empty(len(start_offsets), dtype=cumulative_cost_lookup.dtype)
+        period_values = np.empty(
+            len(start_offsets), dtype=cumulative_value_lookup.dtype
+        )
+        for i in prange(len(start_offsets)):
+            start = start_offsets[i]
+            end = start + durations[i]
+            period_costs[i] = (
+                cumulative_cost_lookup[end] - cumulative_cost_lookup[start]
+            )
+            period_values[i] = (
+                cumulative_value_lookup[end] - cumulative_value_lookup[start]
+            )
+
+        return period_costs, period_values
+
+    return compiled_bulk_period_sums, compiled_bulk_period_cost_and_value_sums
+
+
+def _check_period_bounds(
+    lookup_length: int, start_offsets: np.ndarray, durations: np.ndarray
+) -> np.ndarray:
+    # The compiled kernels do not bounds-check, and NumPy silently wraps negative indices
+    end_offsets = start_offsets + durations
+    if len(start_offsets) == 0:
+        return end_offsets
+
+    if (
+        start_offsets.min() < 0
+        or durations.min() < 0
+        or end_offsets.max() >= lookup_length
+    ):
+        raise IndexError(
+            f"Periods must lie within the {lookup_length - 1} days of the lookup"
+        )
+
+    return end_offsets
+
+
+def bulk_period_sums(
+    cumulative_lookup: np.ndarray, start_offsets: np.ndarray, durations: np.ndarray
+) -> np.ndarray:
+    end_offsets = _check_period_bounds(len(cumulative_lookup), start_offsets, durations)
+    kernels = _kernels()
+    if kernels is None:
+        return cumulative_lookup[end_offsets] - cumulative_lookup[start_offsets]
+
+    compiled_bulk_period_sums, _ = kernels
+    return compiled_bulk_period_sums(cumulative_lookup, start_offsets, durations)
+
+
+def bulk_period_cost_and_value_sums(
+    cumulative_cost_lookup: np.ndarray,
+    cumulative_value_lookup: np.ndarray,
+    start_offsets: np.ndarray,
+    durations: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    end_offsets = _check_period_bounds(
+        min(len(cumulative_cost_lookup), len(cumulative_value_lookup)),
+        start_offsets,
+        durations,
+    )
+    kernels = _kernels()
+    if kernels is None:
+        return (
+            cumulative_cost_lookup[end_offsets] - cumulative_cost_lookup[start_offsets],
+            cumulative_value_lookup[end_offsets]
+            - cumulative_value_lookup[start_offsets],
+        )
+
+    _, compiled_bulk_period_cost_and_value_sums = kernels
+    return compiled_bulk_period_cost_and_value_sums(
+        cumulative_cost_lookup, cumulative_value_lookup, start_offsets, durations
+    )
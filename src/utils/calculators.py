@@ -1,8 +1,14 @@
+from collections.abc import Collection
 from datetime import date
 
+import numpy as np
+
 from src.config import ModelConfig
 from src.mdl.period import HolidayPeriod
-from src.utils.enums import Weekday
+from src.utils._numba_kernels import (
+    bulk_period_cost_and_value_sums,
+    bulk_period_sums,
+)
 from src.utils.time import Time
 
 
@@ -11,20 +17,27 @@ class CalculateCost:
     def generate_single_date_cost_lookup(
         all_dates_in_period: list[date], cost_free_dates: list[date]
     ) -> dict[date, int]:
-        dict_cost = {}
-
-        for datestamp in all_dates_in_period:
-            if Time.is_weekend_day(datestamp):
-                dict_cost[datestamp] = 0
-                continue
+        cost_free_set = set(cost_free_dates)
+        return {
+            datestamp: (
+                0 if Time.is_weekend_day(datestamp) or datestamp in cost_free_set else 1
+            )
+            for datestamp in all_dates_in_period
+        }
 
-            if datestamp in cost_free_dates:
-                dict_cost[datestamp] = 0
-                continue
+    @staticmethod
+    def build_daily_cost_lookup(
+        start_date: date, num_days: int, cost_free_dates: list[date]
+    ) -> np.ndarray:
+        # Array indexed by the offset (in days) from start_date
+        ordinals = start_date.toordinal() + np.arange(num_days)
+        is_weekend = Time.ordinals_in_weekday_mask(ordinals, Time.WEEKEND_MASK)
+        daily_cost = np.where(is_weekend, 0, 1).astype(np.int64)
 
-            dict_cost[datestamp] = 1
+        offsets = [(d - start_date).days for d in cost_free_dates]
+        daily_cost[[o for o in offsets if 0 <= o < num_days]] = 0
 
-        return dict_cost
+        return daily_cost
 
     @staticmethod
     def for_holiday_period(
@@ -36,6 +49,28 @@ class CalculateCost:
 
         return total_cost
 
+    @staticmethod
+    def for_holiday_period_from_lookup(
+        period: HolidayPeriod, daily_cost_lookup: np.ndarray, lookup_start_date: date
+    ) -> int:
+        offset = (period.start_date() - lookup_start_date).days
+        return int(daily_cost_lookup[offset : offset + period.duration()].sum())
+
+    @staticmethod
+    def build_cumulative_cost_lookup(daily_cost_lookup: np.ndarray) -> np.ndarray:
+        # Entry i holds the summed cost of the first i days, so any period is a single subtraction
+        return np.concatenate([[0], np.cumsum(daily_cost_lookup)])
+
+    @staticmethod
+    def for_period_arrays(
+        start_ordinals: np.ndarray,
+        durations: np.ndarray,
+        cumulative_cost_lookup: np.ndarray,
+        lookup_start_date: date,
+    ) -> np.ndarray:
+        start_offsets = start_ordinals - lookup_start_date.toordinal()
+        return bulk_period_sums(cumulative_cost_lookup, start_offsets, durations)
+
 
 class CalculateUtility:
     @staticmethod
@@ -62,12 +97,12 @@ class CalculateUtility:
     @staticmethod
     def marginal_value_of_a_single_day(
         date_to_check: date,
-        preferred_weekdays_off: list[Weekday],
-        preferred_dates_off: list[date],
+        preferred_weekday_mask: int,
+        preferred_dates_off: Collection[date],
     ) -> float:
         utility = ModelConfig.BASELINE_MARGINAL_VALUE
 
-        if Weekday(date_to_check.isoweekday()) in preferred_weekdays_off:
+        if Time.is_in_weekday_mask(date_to_check, preferred_weekday_mask):
             utility += ModelConfig.BONUS_MARGINAL_VALUE
             return utility
 
@@ -80,28 +115,119 @@ class CalculateUtility:
     @staticmethod
     def summed_marginal_value_for_period(
         period: HolidayPeriod,
-        preferred_weekdays_off: list[Weekday],
-        preferred_dates_off: list[date],
+        preferred_weekday_mask: int,
+        preferred_dates_off: Collection[date],
     ) -> float:
         total_value = 0
         for day in period.all_days():
             total_value += CalculateUtility.marginal_value_of_a_single_day(
-                day, preferred_weekdays_off, preferred_dates_off
+                day, preferred_weekday_mask, preferred_dates_off
             )
 
         return total_value
 
+    @staticmethod
+    def build_daily_value_lookup(
+        start_date: date,
+        num_days: int,
+        preferred_weekday_mask: int,
+        preferred_dates_off: Collection[date],
+    ) -> np.ndarray:
+        # Array indexed by the offset (in days) from start_date
+        ordinals = start_date.toordinal() + np.arange(num_days)
+        is_preferred = Time.ordinals_in_weekday_mask(ordinals, preferred_weekday_mask)
+
+        offsets = [(d - start_date).days for d in preferred_dates_off]
+        is_preferred[[o for o in offsets if 0 <= o < num_days]] = True
+
+        daily_value = np.full(
+            num_days, ModelConfig.BASELINE_MARGINAL_VALUE, dtype=float
+        )
+        daily_value[is_preferred] += ModelConfig.BONUS_MARGINAL_VALUE
+        return daily_value
+
+    @staticmethod
+    def summed_marginal_value_from_lookup(
+        period: HolidayPeriod, daily_value_lookup: np.ndarray, lookup_start_date: date
+    ) -> float:
+        offset = (period.start_date() - lookup_start_date).days
+        return float(daily_value_lookup[offset : offset + period.duration()].sum())
+
+    @staticmethod
+    def build_cumulative_value_lookup(daily_value_lookup: np.ndarray) -> np.ndarray:
+        # Prefix sums over the daily values, see CalculateCost.build_cumulative_cost_lookup
+        return np.concatenate([[0.0], np.cumsum(daily_value_lookup)])
+
+    @staticmethod
+    def summed_marginal_value_for_period_arrays(
+        start_ordinals: np.ndarray,
+        durations: np.ndarray,
+        cumulative_value_lookup: np.ndarray,
+        lookup_start_date: date,
+    ) -> np.ndarray:
+        start_offsets = start_ordinals - lookup_start_date.toordinal()
+        return bulk_period_sums(cumulative_value_lookup, start_offsets, durations)
+
+    @staticmethod
+    def bulk_total_value(
+        start_ordinals: np.ndarray,
+        durations: np.ndarray,
+        cumulative_value_lookup: np.ndarray,
+        lookup_start_date: date,
+    ) -> np.ndarray:
+        # Vectorized counterpart of total_value_for_period for many periods at once
+        summed_marginal = CalculateUtility.summed_marginal_value_for_period_arrays(
+            start_ordinals, durations, cumulative_value_lookup, lookup_start_date
+        )
+        return CalculateUtility.__total_value_from_summed_marginal(
+            summed_marginal, durations
+        )
+
+    @staticmethod
+    def cost_and_value_bulk(
+        start_ordinals: np.ndarray,
+        durations: np.ndarray,
+        cumulative_cost_lookup: np.ndarray,
+        cumulative_value_lookup: np.ndarray,
+        lookup_start_date: date,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # Cost and total value of many periods, reading both prefix sums in a single pass
+        start_offsets = start_ordinals - lookup_start_date.toordinal()
+        costs, summed_marginal = bulk_period_cost_and_value_sums(
+            cumulative_cost_lookup, cumulative_value_lookup, start_offsets, durations
+        )
+        total_values = CalculateUtility.__total_value_from_summed_marginal(
+            summed_marginal, durations
+        )
+        return costs, total_values
+
+    @staticmethod
+    def __total_value_from_summed_marginal(
+        summed_marginal: np.ndarray, durations: np.ndarray
+    ) -> np.ndarray:
+        min_duration = ModelConfig.PERIOD_LENGTH_GAIN_START
+        max_duration = ModelConfig.PERIOD_LENGTH_GAIN_CUTOFF
+        period_based = (
+            np.clip(durations - min_duration + 1, 0, max_duration - min_duration + 1)
+            * ModelConfig.DURATION_COMPONENT_SCALER
+        )
+
+        total_value = summed_marginal + period_based
+        return np.where(
+            durations < ModelConfig.MIN_TIME_OFF_TO_GET_VALUE, 0.0, total_value
+        )
+
     @staticmethod
     def total_value_for_period(
         period: HolidayPeriod,
-        preferred_weekdays_off: list[Weekday],
-        preferred_dates_off: list[date],
+        preferred_weekday_mask: int,
+        preferred_dates_off: Collection[date],
     ) -> float:
         if period.duration() < ModelConfig.MIN_TIME_OFF_TO_GET_VALUE:
             return 0
 
         summed_marginal = CalculateUtility.summed_marginal_value_for_period(
-            period, preferred_weekdays_off, preferred_dates_off
+            period, preferred_weekday_mask, preferred_dates_off
         )
         period_based = CalculateUtility.duration_dependent_component(period.duration())
         return summed_marginal + period_based
@@ -1,10 +1,34 @@
-from datetime import date, timedelta
+from datetime import date
 from enum import Enum
 
+import numpy as np
+
 from src.mdl.period import HolidayPeriod
+from src.utils.enums import Weekday
 
 
 class Time:
+    # Bit (isoweekday - 1) is set for every weekday in a mask, e.g. Saturday and Sunday
+    WEEKEND_MASK: int = 0b1100000
+
+    @staticmethod
+    def weekday_mask(weekdays: list[Weekday]) -> int:
+        return sum(1 << (wd.value - 1) for wd in set(weekdays))
+
+    @staticmethod
+    def is_in_weekday_mask(day: date, mask: int) -> bool:
+        return bool(mask & (1 << (day.isoweekday() - 1)))
+
+    @staticmethod
+    def ordinal_to_isoweekday(ordinal: int | np.ndarray) -> int | np.ndarray:
+        # Ordinal 1 (0001-01-01) is a Monday
+        return (ordinal - 1) % 7 + 1
+
+    @staticmethod
+    def ordinals_in_weekday_mask(ordinals: np.ndarray, mask: int) -> np.ndarray:
+        isoweekdays = Time.ordinal_to_isoweekday(ordinals)
+        return ((mask >> (isoweekdays - 1)) & 1).astype(bool)
+
     @staticmethod
     def is_weekend_day(day: date) -> bool:
         return day.isoweekday() in [6, 7]
@@ -15,20 +39,49 @@ class Time:
 
 
 class PeriodFactory:
+    @staticmethod
+    def generate_all_possible_holiday_periods_arrays(
+        all_dates: list[date], max_period_length: int, min_period_length: int = 1
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # Periods are represented as two parallel arrays: start ordinals and durations.
+        # Periods shorter than min_period_length are never generated. Pruning the
+        # periods that carry no value (ModelConfig.MIN_TIME_OFF_TO_GET_VALUE) is only
+        # safe without must-have dates, which such periods may cover cheaply.
+        if min_period_length < 1:
+            raise ValueError(
+                f"min_period_length must be at least 1, got {min_period_length}"
+            )
+        if len(all_dates) == 0:
+            raise ValueError("all_dates must not be empty")
+
+        start_ordinals = np.sort(
+            np.fromiter(
+                (d.toordinal() for d in all_dates), dtype=np.int32, count=len(all_dates)
+            )
+        )
+        durations = np.arange(min_period_length, max_period_length + 1, dtype=np.int32)
+
+        # Expand all (start, duration) pairs at once and keep those ending before the
+        # planning end date.
+        starts_grid, durations_grid = np.meshgrid(
+            start_ordinals, durations, indexing="ij"
+        )
+        mask = (starts_grid + durations_grid) <= start_ordinals[-1]
+
+        return starts_grid[mask], durations_grid[mask]
+
     @staticmethod
     def generate_all_possible_holiday_periods(
-        all_dates: list[date], max_period_length: int
+        all_dates: list[date], max_period_length: int, min_period_length: int = 1
     ) -> list[HolidayPeriod]:
-        planning_end_date = max(all_dates)
         all_dates.sort()
+        start_ordinals, durations = (
+            PeriodFactory.generate_all_possible_holiday_periods_arrays(
+                all_dates, max_period_length, min_period_length
+            )
+        )
 
-        all_periods = []
-        for start_date in all_dates:
-            for duration in range(1, max_period_length + 1):
-                if start_date + timedelta(days=duration) > planning_end_date:
-                    break
-
-                new_period = HolidayPeriod(start_date, duration)
-                all_periods.append(new_period)
-
-        return all_periods
+        return [
+            HolidayPeriod.from_arrays(start_ordinals, durations, i)
+            for i in range(len(start_ordinals))
+        ]